@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_schedule_entries_start_minutes", "schedule_entries", ["start_minutes"])
+    op.create_index("ix_schedule_entries_end_minutes", "schedule_entries", ["end_minutes"])
+    op.create_index("ix_schedule_entries_days", "schedule_entries", ["days"])
+    op.create_index("ix_schedule_entries_room", "schedule_entries", ["room"])
+    op.create_index("ix_schedule_entries_faculty", "schedule_entries", ["faculty"])
+    op.create_index("ix_schedule_entries_room_days", "schedule_entries", ["room", "days"])
+    op.create_index("ix_schedule_entries_faculty_days", "schedule_entries", ["faculty", "days"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_entries_faculty_days", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_room_days", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_faculty", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_room", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_days", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_end_minutes", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_start_minutes", table_name="schedule_entries")
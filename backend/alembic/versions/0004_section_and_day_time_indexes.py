@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_schedule_entries_section", "schedule_entries", ["section"])
+    op.create_index(
+        "ix_schedule_entries_day_time",
+        "schedule_entries",
+        ["days", "start_minutes", "end_minutes"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_entries_day_time", table_name="schedule_entries")
+    op.drop_index("ix_schedule_entries_section", table_name="schedule_entries")
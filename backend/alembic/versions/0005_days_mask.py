@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from app import time_utils
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "schedule_entries",
+        sa.Column("days_mask", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_schedule_entries_days_mask", "schedule_entries", ["days_mask"])
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, days FROM schedule_entries")
+    ).fetchall()
+    for entry_id, days in rows:
+        mask = time_utils.days_mask(days) if days else 0
+        connection.execute(
+            sa.text("UPDATE schedule_entries SET days_mask = :mask WHERE id = :id"),
+            {"mask": mask, "id": entry_id},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_entries_days_mask", table_name="schedule_entries")
+    op.drop_column("schedule_entries", "days_mask")
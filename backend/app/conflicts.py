@@ -1,10 +1,44 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from . import models
-from .time_utils import normalize_days, overlap
+from .time_utils import days_mask
+
+# Below this many scheduled entries the bucketed Python sweep wins; above it
+# the broadcasted NumPy comparison is worth the N x N boolean matrices.
+NUMPY_MIN_ENTRIES = 256
+
+# Lightweight conflict records: a NamedTuple costs a fraction of the dict
+# previously allocated per conflict, and large schedules emit thousands.
+class Conflict(NamedTuple):
+    entry_id: int
+    conflicts_with: int
+    conflict_type: str
+
+
+class CandidateConflict(NamedTuple):
+    conflict_type: str
+    entry: models.ScheduleEntry
+
+# Only the columns conflict detection actually reads; fetching plain rows
+# instead of ORM instances skips attribute instrumentation and leaves the
+# wide text columns (course description, timestamps) in the database.
+_CONFLICT_COLUMNS = select(
+    models.ScheduleEntry.id,
+    models.ScheduleEntry.time_lpu,
+    models.ScheduleEntry.days,
+    models.ScheduleEntry.days_mask,
+    models.ScheduleEntry.section,
+    models.ScheduleEntry.room,
+    models.ScheduleEntry.faculty,
+    models.ScheduleEntry.start_minutes,
+    models.ScheduleEntry.end_minutes,
+)
 
 
 def _is_tba(value: str | None) -> bool:
@@ -14,17 +48,24 @@ def _is_tba(value: str | None) -> bool:
     return cleaned in {"", "tba"}
 
 
-def _matches_ignore(value: str, ignore_list: list[str], contains: bool) -> bool:
+def _iter_day_bits(mask: int):
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        yield bit
+
+
+def _normalized_ignore_set(ignore_list: list[str] | None) -> set[str]:
+    return {item.strip().lower() for item in ignore_list or [] if item.strip()}
+
+
+def _is_ignored(value: str, ignore_set: set[str], contains: bool) -> bool:
+    if not ignore_set:
+        return False
     target = value.strip().lower()
-    for item in ignore_list:
-        candidate = item.strip().lower()
-        if not candidate:
-            continue
-        if contains and candidate in target:
-            return True
-        if not contains and candidate == target:
-            return True
-    return False
+    if contains:
+        return any(item in target for item in ignore_set)
+    return target in ignore_set
 
 
 def find_conflicts(
@@ -36,64 +77,171 @@ def find_conflicts(
     ignore_room_list: list[str] | None = None,
     contains_faculty: bool = False,
     contains_room: bool = False,
-) -> list[dict]:
-    entries = list(db.scalars(select(models.ScheduleEntry)))
-    conflicts: list[dict] = []
-    ignore_faculty_list = ignore_faculty_list or []
-    ignore_room_list = ignore_room_list or []
+) -> list[Conflict]:
+    entries = db.execute(_CONFLICT_COLUMNS).all()
+    ignore_faculty_set = _normalized_ignore_set(ignore_faculty_list)
+    ignore_room_set = _normalized_ignore_set(ignore_room_list)
+
+    candidates = []
     for entry in entries:
         if entry.start_minutes is None or entry.end_minutes is None:
             continue
         if ignore_tba and (_is_tba(entry.time_lpu) or _is_tba(entry.days)):
             continue
-        entry_days = normalize_days(entry.days)
-        for other in entries:
-            if entry.id == other.id:
-                continue
-            if other.start_minutes is None or other.end_minutes is None:
-                continue
-            if ignore_tba and (_is_tba(other.time_lpu) or _is_tba(other.days)):
-                continue
-            if not overlap(entry.start_minutes, entry.end_minutes, other.start_minutes, other.end_minutes):
-                continue
-            if not entry_days.intersection(normalize_days(other.days)):
+        candidates.append(entry)
+
+    # Stored mask when the row has one; re-encode from the days string for
+    # rows written before the days_mask column existed.
+    masks = [entry.days_mask or days_mask(entry.days) for entry in candidates]
+
+    if len(candidates) >= NUMPY_MIN_ENTRIES:
+        return _find_conflicts_numpy(
+            candidates,
+            masks,
+            ignore_room=ignore_room,
+            ignore_faculty=ignore_faculty,
+            ignore_room_set=ignore_room_set,
+            ignore_faculty_set=ignore_faculty_set,
+            contains_room=contains_room,
+            contains_faculty=contains_faculty,
+        )
+
+    # Bucket entries by (day bit, resource value): only entries sharing a day
+    # and an exact section/room/faculty string can ever conflict, so each
+    # sweep only compares genuine candidates. All three bucket families are
+    # filled in a single pass over the candidates, with ignore-listed entries
+    # kept out of the corresponding buckets up front.
+    section_buckets: dict[tuple[int, str], list] = {}
+    room_buckets: dict[tuple[int, str], list] = {}
+    faculty_buckets: dict[tuple[int, str], list] = {}
+    for entry, mask in zip(candidates, masks):
+        bucket_room = not ignore_room and not _is_ignored(entry.room, ignore_room_set, contains_room)
+        bucket_faculty = not ignore_faculty and not _is_ignored(
+            entry.faculty, ignore_faculty_set, contains_faculty
+        )
+        for bit in _iter_day_bits(mask):
+            section_buckets.setdefault((bit, entry.section), []).append(entry)
+            if bucket_room:
+                room_buckets.setdefault((bit, entry.room), []).append(entry)
+            if bucket_faculty:
+                faculty_buckets.setdefault((bit, entry.faculty), []).append(entry)
+
+    conflicts: list[Conflict] = []
+    seen: set[tuple[int, int, str]] = set()
+
+    def emit(entry, other, conflict_type: str) -> None:
+        key = (min(entry.id, other.id), max(entry.id, other.id), conflict_type)
+        if key in seen:
+            return
+        seen.add(key)
+        conflicts.append(Conflict(entry.id, other.id, conflict_type))
+        conflicts.append(Conflict(other.id, entry.id, conflict_type))
+
+    def sweep(buckets: dict[tuple[int, str], list], conflict_type: str) -> None:
+        for bucket in buckets.values():
+            if len(bucket) < 2:
                 continue
-            if entry.section == other.section:
-                conflicts.append({
-                    "entry_id": entry.id,
-                    "conflicts_with": other.id,
-                    "conflict_type": "section",
-                })
-            if not ignore_room:
-                if _matches_ignore(entry.room, ignore_room_list, contains_room) or _matches_ignore(
-                    other.room, ignore_room_list, contains_room
-                ):
-                    pass
-                elif entry.room == other.room:
-                    conflicts.append({
-                        "entry_id": entry.id,
-                        "conflicts_with": other.id,
-                        "conflict_type": "room",
-                    })
-            if not ignore_faculty:
-                if _matches_ignore(entry.faculty, ignore_faculty_list, contains_faculty) or _matches_ignore(
-                    other.faculty, ignore_faculty_list, contains_faculty
-                ):
-                    pass
-                elif entry.faculty == other.faculty:
-                    conflicts.append({
-                        "entry_id": entry.id,
-                        "conflicts_with": other.id,
-                        "conflict_type": "faculty",
-                    })
+            bucket.sort(key=lambda entry: entry.start_minutes)
+            for index, entry in enumerate(bucket):
+                entry_end = entry.end_minutes
+                for j in range(index + 1, len(bucket)):
+                    other = bucket[j]
+                    # Sorted by start, so nothing after this can overlap `entry`.
+                    if other.start_minutes >= entry_end:
+                        break
+                    emit(entry, other, conflict_type)
+
+    sweep(section_buckets, "section")
+    sweep(room_buckets, "room")
+    sweep(faculty_buckets, "faculty")
     return conflicts
 
 
-def conflicts_for_entry(db: Session, entry_id: int) -> list[dict]:
-    conflicts = [c for c in find_conflicts(db) if c["entry_id"] == entry_id]
+def _find_conflicts_numpy(
+    candidates: list,
+    masks: list[int],
+    ignore_room: bool,
+    ignore_faculty: bool,
+    ignore_room_set: set[str],
+    ignore_faculty_set: set[str],
+    contains_room: bool,
+    contains_faculty: bool,
+) -> list[Conflict]:
+    n = len(candidates)
+    ids = np.fromiter((entry.id for entry in candidates), dtype=np.int64, count=n)
+    starts = np.fromiter((entry.start_minutes for entry in candidates), dtype=np.int32, count=n)
+    ends = np.fromiter((entry.end_minutes for entry in candidates), dtype=np.int32, count=n)
+    day_bits = np.fromiter(masks, dtype=np.int16, count=n)
+
+    # Pairwise time-and-day overlap computed in one broadcast; everything
+    # below just intersects this matrix with per-type equality. Restricting
+    # it to the upper triangle here means each unordered pair is considered
+    # once and the per-type passes need no further triangular masking.
+    overlapping = (starts[:, None] < ends[None, :]) & (starts[None, :] < ends[:, None])
+    overlapping &= (day_bits[:, None] & day_bits[None, :]) != 0
+    overlapping &= ~np.tri(n, dtype=bool)
+
+    conflicts: list[Conflict] = []
+
+    def emit_type(values: list[str], ignored: list[bool] | None, conflict_type: str) -> None:
+        codes = np.unique(np.array(values, dtype=object), return_inverse=True)[1]
+        matching = overlapping & (codes[:, None] == codes[None, :])
+        if ignored is not None:
+            kept = ~np.array(ignored, dtype=bool)
+            matching &= kept[:, None] & kept[None, :]
+        i_idx, j_idx = matching.nonzero()
+        for i, j in zip(i_idx.tolist(), j_idx.tolist()):
+            entry_id, other_id = int(ids[i]), int(ids[j])
+            conflicts.append(Conflict(entry_id, other_id, conflict_type))
+            conflicts.append(Conflict(other_id, entry_id, conflict_type))
+
+    emit_type([entry.section for entry in candidates], None, "section")
+    if not ignore_room:
+        emit_type(
+            [entry.room for entry in candidates],
+            [_is_ignored(entry.room, ignore_room_set, contains_room) for entry in candidates],
+            "room",
+        )
+    if not ignore_faculty:
+        emit_type(
+            [entry.faculty for entry in candidates],
+            [_is_ignored(entry.faculty, ignore_faculty_set, contains_faculty) for entry in candidates],
+            "faculty",
+        )
     return conflicts
 
 
+def conflicts_for_entry(
+    db: Session,
+    entry_id: int,
+    ignore_faculty: bool = False,
+    ignore_room: bool = False,
+    ignore_tba: bool = False,
+    ignore_faculty_list: list[str] | None = None,
+    ignore_room_list: list[str] | None = None,
+    contains_faculty: bool = False,
+    contains_room: bool = False,
+) -> list[Conflict]:
+    entry = db.get(models.ScheduleEntry, entry_id)
+    if entry is None:
+        return []
+    return [
+        Conflict(entry_id, conflict.entry.id, conflict.conflict_type)
+        for conflict in conflicts_for_candidate(
+            db,
+            entry_id,
+            entry,
+            ignore_faculty=ignore_faculty,
+            ignore_room=ignore_room,
+            ignore_tba=ignore_tba,
+            ignore_faculty_list=ignore_faculty_list,
+            ignore_room_list=ignore_room_list,
+            contains_faculty=contains_faculty,
+            contains_room=contains_room,
+        )
+    ]
+
+
 def conflicts_for_candidate(
     db: Session,
     entry_id: int,
@@ -105,41 +253,50 @@ def conflicts_for_candidate(
     ignore_room_list: list[str] | None = None,
     contains_faculty: bool = False,
     contains_room: bool = False,
-) -> list[dict]:
-    entries = list(db.scalars(select(models.ScheduleEntry)))
-    conflicts: list[dict] = []
-    ignore_faculty_list = ignore_faculty_list or []
-    ignore_room_list = ignore_room_list or []
+) -> list[CandidateConflict]:
+    conflicts: list[CandidateConflict] = []
+    ignore_faculty_set = _normalized_ignore_set(ignore_faculty_list)
+    ignore_room_set = _normalized_ignore_set(ignore_room_list)
     if candidate.start_minutes is None or candidate.end_minutes is None:
         return conflicts
     if ignore_tba and (_is_tba(candidate.time_lpu) or _is_tba(candidate.days)):
         return conflicts
-    candidate_days = normalize_days(candidate.days)
+    candidate_mask = getattr(candidate, "days_mask", 0) or days_mask(candidate.days)
+    candidate_room_ignored = _is_ignored(candidate.room, ignore_room_set, contains_room)
+    candidate_faculty_ignored = _is_ignored(candidate.faculty, ignore_faculty_set, contains_faculty)
+    # Let SQLite discard everything that cannot conflict with the candidate:
+    # the self row, unscheduled entries, non-overlapping times, and entries
+    # sharing none of section/room/faculty. Day overlap cannot be expressed
+    # against the comma-joined days column, so it stays in Python below.
+    entries = db.scalars(
+        select(models.ScheduleEntry).where(
+            models.ScheduleEntry.id != entry_id,
+            models.ScheduleEntry.start_minutes.is_not(None),
+            models.ScheduleEntry.end_minutes.is_not(None),
+            models.ScheduleEntry.start_minutes < candidate.end_minutes,
+            models.ScheduleEntry.end_minutes > candidate.start_minutes,
+            or_(
+                models.ScheduleEntry.section == candidate.section,
+                models.ScheduleEntry.room == candidate.room,
+                models.ScheduleEntry.faculty == candidate.faculty,
+            ),
+        )
+    )
     for other in entries:
-        if other.id == entry_id:
-            continue
-        if other.start_minutes is None or other.end_minutes is None:
-            continue
         if ignore_tba and (_is_tba(other.time_lpu) or _is_tba(other.days)):
             continue
-        if not overlap(candidate.start_minutes, candidate.end_minutes, other.start_minutes, other.end_minutes):
-            continue
-        if not candidate_days.intersection(normalize_days(other.days)):
+        if not candidate_mask & (other.days_mask or days_mask(other.days)):
             continue
         if candidate.section == other.section:
-            conflicts.append({"conflict_type": "section", "entry": other})
+            conflicts.append(CandidateConflict("section", other))
         if not ignore_room:
-            if _matches_ignore(candidate.room, ignore_room_list, contains_room) or _matches_ignore(
-                other.room, ignore_room_list, contains_room
-            ):
+            if candidate_room_ignored or _is_ignored(other.room, ignore_room_set, contains_room):
                 pass
             elif candidate.room == other.room:
-                conflicts.append({"conflict_type": "room", "entry": other})
+                conflicts.append(CandidateConflict("room", other))
         if not ignore_faculty:
-            if _matches_ignore(candidate.faculty, ignore_faculty_list, contains_faculty) or _matches_ignore(
-                other.faculty, ignore_faculty_list, contains_faculty
-            ):
+            if candidate_faculty_ignored or _is_ignored(other.faculty, ignore_faculty_set, contains_faculty):
                 pass
             elif candidate.faculty == other.faculty:
-                conflicts.append({"conflict_type": "faculty", "entry": other})
+                conflicts.append(CandidateConflict("faculty", other))
     return conflicts
@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import sys
 from types import SimpleNamespace
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from . import conflicts, models, time_utils
 from .schemas import ScheduleEntryCreate, ScheduleEntryUpdate
 
 
+# Hot statements built once at import; SQLAlchemy then reuses its compiled
+# SQL cache across calls instead of rebuilding the select each time.
+_SELECT_ALL_ENTRIES = select(models.ScheduleEntry)
+_SELECT_ENTRIES_BY_ID = select(models.ScheduleEntry).order_by(models.ScheduleEntry.id)
+
+# Column tuples in CANONICAL_HEADERS order for the CSV exports; plain rows
+# feed csv.writer directly without the ORM/Pydantic round-trip.
+_SELECT_REPORT_ROWS = select(
+    models.ScheduleEntry.program,
+    models.ScheduleEntry.section,
+    models.ScheduleEntry.course_code,
+    models.ScheduleEntry.course_description,
+    models.ScheduleEntry.units,
+    models.ScheduleEntry.hours,
+    models.ScheduleEntry.time_lpu,
+    models.ScheduleEntry.time_24,
+    models.ScheduleEntry.days,
+    models.ScheduleEntry.room,
+    models.ScheduleEntry.faculty,
+).order_by(models.ScheduleEntry.id).execution_options(yield_per=1000)
+
+
 PLACEHOLDER_ENTITY_NAMES = {
     models.Section: {"no section", "no sections", "no section yet", "no sections yet"},
     models.Faculty: {"no faculty", "no faculty yet"},
@@ -23,6 +46,7 @@ def create_schedule_entry(db: Session, entry: ScheduleEntryCreate) -> models.Sch
         start_minutes = None
         end_minutes = None
         normalized_days = "TBA"
+        days_mask = 0
     else:
         normalized_lpu, time_24, start_minutes, end_minutes = time_utils.parse_time_lpu(
             entry.time_lpu
@@ -30,9 +54,10 @@ def create_schedule_entry(db: Session, entry: ScheduleEntryCreate) -> models.Sch
         normalized_days = time_utils.normalize_days_string(entry.days)
         if not normalized_days:
             raise ValueError("Invalid Days. Example: M,W,F")
+        days_mask = time_utils.days_mask(normalized_days)
     model = models.ScheduleEntry(
         program=entry.program,
-        section=entry.section,
+        section=sys.intern(entry.section),
         course_code=entry.course_code,
         course_description=entry.course_description,
         units=entry.units,
@@ -40,8 +65,9 @@ def create_schedule_entry(db: Session, entry: ScheduleEntryCreate) -> models.Sch
         time_lpu=normalized_lpu,
         time_24=time_24,
         days=normalized_days,
-        room=entry.room,
-        faculty=entry.faculty,
+        days_mask=days_mask,
+        room=sys.intern(entry.room),
+        faculty=sys.intern(entry.faculty),
         start_minutes=start_minutes,
         end_minutes=end_minutes,
     )
@@ -52,6 +78,56 @@ def create_schedule_entry(db: Session, entry: ScheduleEntryCreate) -> models.Sch
     return model
 
 
+def bulk_create_schedule_entries(
+    db: Session, entries: list[ScheduleEntryCreate]
+) -> list[int]:
+    # Bulk path for seeding/import: one executemany insert and one commit
+    # instead of an add/commit/refresh round-trip per row. Unlike
+    # create_schedule_entry this does not run the per-row section-conflict
+    # check, matching the CSV import semantics.
+    params = []
+    for entry in entries:
+        if time_utils.is_tba(entry.time_lpu) or time_utils.is_tba(entry.days):
+            normalized_lpu = "TBA"
+            time_24 = None
+            start_minutes = None
+            end_minutes = None
+            normalized_days = "TBA"
+            days_mask = 0
+        else:
+            normalized_lpu, time_24, start_minutes, end_minutes = time_utils.parse_time_lpu(
+                entry.time_lpu
+            )
+            normalized_days = time_utils.normalize_days_string(entry.days)
+            if not normalized_days:
+                raise ValueError("Invalid Days. Example: M,W,F")
+            days_mask = time_utils.days_mask(normalized_days)
+        params.append({
+            "program": entry.program,
+            "section": sys.intern(entry.section),
+            "course_code": entry.course_code,
+            "course_description": entry.course_description,
+            "units": entry.units,
+            "hours": entry.hours,
+            "time_lpu": normalized_lpu,
+            "time_24": time_24,
+            "days": normalized_days,
+            "days_mask": days_mask,
+            "room": sys.intern(entry.room),
+            "faculty": sys.intern(entry.faculty),
+            "start_minutes": start_minutes,
+            "end_minutes": end_minutes,
+        })
+    if not params:
+        return []
+    result = db.execute(
+        insert(models.ScheduleEntry).returning(models.ScheduleEntry.id), params
+    )
+    entry_ids = [row.id for row in result]
+    db.commit()
+    return entry_ids
+
+
 def update_schedule_entry(
     db: Session, entry_id: int, entry: ScheduleEntryUpdate
 ) -> models.ScheduleEntry:
@@ -64,6 +140,7 @@ def update_schedule_entry(
         start_minutes = None
         end_minutes = None
         normalized_days = "TBA"
+        days_mask = 0
     else:
         normalized_lpu, time_24, start_minutes, end_minutes = time_utils.parse_time_lpu(
             entry.time_lpu
@@ -71,8 +148,9 @@ def update_schedule_entry(
         normalized_days = time_utils.normalize_days_string(entry.days)
         if not normalized_days:
             raise ValueError("Invalid Days. Example: M,W,F")
+        days_mask = time_utils.days_mask(normalized_days)
     model.program = entry.program
-    model.section = entry.section
+    model.section = sys.intern(entry.section)
     model.course_code = entry.course_code
     model.course_description = entry.course_description
     model.units = entry.units
@@ -80,8 +158,9 @@ def update_schedule_entry(
     model.time_lpu = normalized_lpu
     model.time_24 = time_24
     model.days = normalized_days
-    model.room = entry.room
-    model.faculty = entry.faculty
+    model.days_mask = days_mask
+    model.room = sys.intern(entry.room)
+    model.faculty = sys.intern(entry.faculty)
     model.start_minutes = start_minutes
     model.end_minutes = end_minutes
     _raise_for_section_conflict(db, entry_id, model)
@@ -108,7 +187,7 @@ def _raise_for_section_conflict(
                 faculty=candidate.faculty,
             ),
         )
-        if conflict["conflict_type"] == "section"
+        if conflict.conflict_type == "section"
     ]
     if section_conflicts:
         raise ValueError("Section has another class at the same time")
@@ -122,8 +201,36 @@ def delete_schedule_entry(db: Session, entry_id: int) -> None:
     db.commit()
 
 
-def list_schedule_entries(db: Session) -> list[models.ScheduleEntry]:
-    return list(db.scalars(select(models.ScheduleEntry).order_by(models.ScheduleEntry.id)))
+def list_schedule_entries(
+    db: Session,
+    section: str | None = None,
+    faculty: str | None = None,
+    room: str | None = None,
+) -> list[models.ScheduleEntry]:
+    stmt = _SELECT_ENTRIES_BY_ID
+    if section:
+        stmt = stmt.where(models.ScheduleEntry.section == section)
+    if faculty:
+        stmt = stmt.where(models.ScheduleEntry.faculty == faculty)
+    if room:
+        stmt = stmt.where(models.ScheduleEntry.room == room)
+    return list(db.scalars(stmt))
+
+
+def iter_schedule_rows(
+    db: Session,
+    section: str | None = None,
+    faculty: str | None = None,
+    room: str | None = None,
+):
+    stmt = _SELECT_REPORT_ROWS
+    if section:
+        stmt = stmt.where(models.ScheduleEntry.section == section)
+    if faculty:
+        stmt = stmt.where(models.ScheduleEntry.faculty == faculty)
+    if room:
+        stmt = stmt.where(models.ScheduleEntry.room == room)
+    return db.execute(stmt)
 
 
 def get_schedule_entry(db: Session, entry_id: int) -> models.ScheduleEntry | None:
@@ -163,7 +270,7 @@ def _has_merge_conflict(
                 "value": target_name if getattr(entry, field_name) == source_name else getattr(entry, field_name),
                 "start_minutes": entry.start_minutes,
                 "end_minutes": entry.end_minutes,
-                "days": time_utils.normalize_days(entry.days),
+                "days_mask": entry.days_mask or time_utils.days_mask(entry.days),
             }
         )
     for index, left in enumerate(simulated):
@@ -176,7 +283,7 @@ def _has_merge_conflict(
                 continue
             if right["start_minutes"] is None or right["end_minutes"] is None:
                 continue
-            if not left["days"].intersection(right["days"]):
+            if not left["days_mask"] & right["days_mask"]:
                 continue
             if time_utils.overlap(
                 left["start_minutes"],
@@ -217,7 +324,7 @@ def merge_named_entity(db: Session, model_cls, source_id: int, target_name: str)
     if target.id == source.id:
         return source
 
-    entries = list(db.scalars(select(models.ScheduleEntry)))
+    entries = list(db.scalars(_SELECT_ALL_ENTRIES))
     if _has_merge_conflict(entries, model_cls, source.name, target.name):
         raise ValueError(f"Merging would create {model_cls.__name__.lower()} conflicts")
 
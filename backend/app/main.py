@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import csv
 import io
+import itertools
 import json
 import mimetypes
 import shutil
@@ -12,16 +13,22 @@ from uuid import uuid4
 from typing import List
 from types import SimpleNamespace
 
-from fastapi import Depends, FastAPI, File, HTTPException, UploadFile
+from fastapi import Depends, FastAPI, File, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from . import conflicts, crud, models, reports, schemas, time_utils
 from .db import DATABASE_PATH, SessionLocal, engine
 
+# Validates/dumps a whole list of entries in one pydantic-core call instead
+# of a per-row model_validate loop.
+_schedule_entry_list = TypeAdapter(List[schemas.ScheduleEntry])
+
 mimetypes.add_type("text/javascript", ".js")
 mimetypes.add_type("application/javascript", ".mjs")
 mimetypes.add_type("text/css", ".css")
@@ -29,13 +36,14 @@ mimetypes.add_type("application/wasm", ".wasm")
 mimetypes.add_type("application/json", ".json")
 mimetypes.add_type("application/octet-stream", ".map")
 
-app = FastAPI(title="Scheduler API")
+app = FastAPI(title="Scheduler API", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
 
@@ -69,14 +77,7 @@ def list_schedule(
     room: str | None = None,
     db: Session = Depends(get_db),
 ):
-    entries = crud.list_schedule_entries(db)
-    if section:
-        entries = [entry for entry in entries if entry.section == section]
-    if faculty:
-        entries = [entry for entry in entries if entry.faculty == faculty]
-    if room:
-        entries = [entry for entry in entries if entry.room == room]
-    return entries
+    return crud.list_schedule_entries(db, section=section, faculty=faculty, room=room)
 
 
 @app.get("/schedule/{entry_id}", response_model=schemas.ScheduleEntry)
@@ -172,8 +173,8 @@ def move_check(
             "reason": "conflict",
             "conflicts": [
                 {
-                    "conflict_type": conflict["conflict_type"],
-                    "entry": schemas.ScheduleEntry.from_orm(conflict["entry"]).model_dump(
+                    "conflict_type": conflict.conflict_type,
+                    "entry": schemas.ScheduleEntry.model_validate(conflict.entry).model_dump(
                         by_alias=True
                     ),
                 }
@@ -325,8 +326,8 @@ def list_conflicts(
     )
     grouped = {}
     for conflict in conflicts_list:
-        grouped.setdefault((conflict["entry_id"], conflict["conflict_type"]), []).append(
-            conflict["conflicts_with"]
+        grouped.setdefault((conflict.entry_id, conflict.conflict_type), []).append(
+            conflict.conflicts_with
         )
     response = [
         schemas.ConflictSummary(
@@ -341,13 +342,10 @@ def list_conflicts(
 
 @app.get("/reports/text.csv")
 def export_text_csv(db: Session = Depends(get_db)):
-    entries = [
-        schemas.ScheduleEntry.from_orm(entry).model_dump(by_alias=True)
-        for entry in crud.list_schedule_entries(db)
-    ]
-    rows = reports.build_text_rows(entries)
-    content = reports.write_csv(rows)
-    return Response(content, media_type="text/csv")
+    # Plain column tuples straight from the database; csv.writer stringifies
+    # them identically to the former ORM -> Pydantic -> dict round-trip.
+    rows = itertools.chain([schemas.CANONICAL_HEADERS], crud.iter_schedule_rows(db))
+    return StreamingResponse(reports.stream_csv(rows), media_type="text/csv")
 
 
 @app.get("/settings", response_model=schemas.AppSettingsPayload)
@@ -364,31 +362,15 @@ def update_settings(payload: schemas.AppSettingsPayload, db: Session = Depends(g
     return schemas.AppSettingsPayload(settings=json.loads(instance.settings_json))
 
 
-def filter_entries(entries, group: str, filter_value: str | None):
-    if group not in {"section", "faculty", "room"}:
-        raise HTTPException(status_code=400, detail="Invalid group")
-    if group == "section":
-        if filter_value:
-            entries = [e for e in entries if e["Section"] == filter_value]
-    elif group == "faculty":
-        if filter_value:
-            entries = [e for e in entries if e["Faculty"] == filter_value]
-    elif group == "room":
-        if filter_value:
-            entries = [e for e in entries if e["Room"] == filter_value]
-    return entries
-
-
 @app.get("/reports/timetable/{group}.csv")
 def export_timetable_csv(group: str, filter_value: str | None = None, db: Session = Depends(get_db)):
-    entries = [
-        schemas.ScheduleEntry.from_orm(entry).model_dump(by_alias=True)
-        for entry in crud.list_schedule_entries(db)
-    ]
-    entries = filter_entries(entries, group, filter_value)
-    rows = reports.build_text_rows(entries)
-    content = reports.write_csv(rows)
-    return Response(content, media_type="text/csv")
+    if group not in {"section", "faculty", "room"}:
+        raise HTTPException(status_code=400, detail="Invalid group")
+    # Filter in SQL so only matching rows are fetched and serialized.
+    rows = itertools.chain(
+        [schemas.CANONICAL_HEADERS], crud.iter_schedule_rows(db, **{group: filter_value})
+    )
+    return StreamingResponse(reports.stream_csv(rows), media_type="text/csv")
 
 
 @app.get("/reports/faculty-load.html")
@@ -396,11 +378,12 @@ def export_faculty_load(faculty: str, db: Session = Depends(get_db)):
     faculty_name = faculty.strip()
     if not faculty_name:
         raise HTTPException(status_code=400, detail="Faculty is required")
-    entries = [
-        schemas.ScheduleEntry.from_orm(entry).model_dump(by_alias=True)
-        for entry in crud.list_schedule_entries(db)
-        if entry.faculty == faculty_name
-    ]
+    entries = _schedule_entry_list.dump_python(
+        _schedule_entry_list.validate_python(
+            crud.list_schedule_entries(db, faculty=faculty_name), from_attributes=True
+        ),
+        by_alias=True,
+    )
     content = reports.build_faculty_load_html(faculty_name, entries)
     safe_name = "".join(char if char.isalnum() or char in "-_" else "_" for char in faculty_name)
     return Response(
@@ -415,7 +398,9 @@ def import_database(file: UploadFile = File(...)):
     target = DATABASE_PATH
     temp_path = target.with_suffix(".upload")
     with temp_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        # 1 MiB chunks instead of copyfileobj's 64 KiB default; fewer
+        # Python-level read/write round-trips for multi-megabyte databases.
+        shutil.copyfileobj(file.file, buffer, length=1 << 20)
     shutil.move(str(temp_path), target)
     with SessionLocal() as db:
         models.Base.metadata.create_all(bind=engine)
@@ -428,6 +413,7 @@ def import_csv(
     file: UploadFile = File(...),
     replace: bool = False,
     preview: bool = False,
+    batch_size: int = Query(5000, ge=1),
     db: Session = Depends(get_db),
 ):
     payload = file.file.read()
@@ -492,37 +478,72 @@ def import_csv(
         db.query(models.ScheduleEntry).delete()
         db.commit()
 
-    sections = {section.name.lower(): section for section in db.scalars(select(models.Section))}
-    faculty = {item.name.lower(): item for item in db.scalars(select(models.Faculty))}
-    rooms = {item.name.lower(): item for item in db.scalars(select(models.Room))}
+    intern = sys.intern
+    existing_sections = {intern(name.lower()) for name in db.scalars(select(models.Section.name))}
+    existing_faculty = {intern(name.lower()) for name in db.scalars(select(models.Faculty.name))}
+    existing_rooms = {intern(name.lower()) for name in db.scalars(select(models.Room.name))}
+
+    # Distinct names seen during the row loop, keyed by lowercase with the
+    # first-seen casing kept; missing ones are bulk-inserted after the loop
+    # instead of interleaving per-row entity adds with the entry inserts.
+    new_sections: dict[str, str] = {}
+    new_faculty: dict[str, str] = {}
+    new_rooms: dict[str, str] = {}
+
+    def insert_missing_entities() -> None:
+        for model_cls, existing, new in (
+            (models.Section, existing_sections, new_sections),
+            (models.Faculty, existing_faculty, new_faculty),
+            (models.Room, existing_rooms, new_rooms),
+        ):
+            names = [{"name": name} for key, name in new.items() if key not in existing]
+            if names:
+                db.execute(
+                    sqlite_insert(model_cls).on_conflict_do_nothing(index_elements=["name"]),
+                    names,
+                )
+
+    # Validated rows are collected here and flushed with a Core executemany
+    # insert instead of a db.add() per row; skipping the ORM unit-of-work
+    # makes large imports roughly an order of magnitude faster. Flushing
+    # every batch_size rows keeps memory bounded on very large CSVs.
+    pending: list[dict] = []
 
-    def ensure_entity(name: str, collection: dict, model_cls):
-        key = name.lower()
-        instance = collection.get(key)
-        if instance:
-            return instance
-        instance = model_cls(name=name)
-        db.add(instance)
-        collection[key] = instance
-        return instance
+    def flush_pending() -> None:
+        if pending:
+            db.execute(insert(models.ScheduleEntry), pending)
+            db.commit()
+            pending.clear()
+
+    # Column positions resolved once; the row loop then indexes by position
+    # instead of creating a closure and doing dict lookups per cell.
+    col_indices = tuple(header_map[header] for header in required_headers)
 
     for idx, row in enumerate(reader, start=2):
         rows_total += 1
         try:
-            def get_value(header: str) -> str:
-                value = row[header_map[header]] if header_map.get(header) is not None and len(row) > header_map[header] else ""
-                return value.strip()
-
-            program = get_value("Program")
-            section = get_value("Section")
-            course_code = get_value("Course Code")
-            course_description = get_value("Course Description")
-            units = get_value("Units")
-            hours = get_value("# of Hours")
-            time_lpu = get_value("Time (LPU Std)")
-            days = get_value("Days")
-            room = get_value("Room")
-            faculty_name = get_value("Faculty")
+            row_len = len(row)
+            (
+                program,
+                section,
+                course_code,
+                course_description,
+                units,
+                hours,
+                time_lpu,
+                days,
+                room,
+                faculty_name,
+            ) = [row[i].strip() if i < row_len else "" for i in col_indices]
+
+            # These columns repeat the same handful of values across many
+            # rows; interning shares one string object per distinct value and
+            # turns the entity-dict lookups into pointer comparisons.
+            program = intern(program)
+            section = intern(section)
+            days = intern(days)
+            room = intern(room)
+            faculty_name = intern(faculty_name)
 
             if time_utils.is_tba(time_lpu) or time_utils.is_tba(days):
                 normalized_lpu = "TBA"
@@ -530,6 +551,7 @@ def import_csv(
                 time_24 = None
                 start_minutes = None
                 end_minutes = None
+                days_mask = 0
             else:
                 normalized_lpu, time_24, start_minutes, end_minutes = time_utils.parse_time_lpu(
                     time_lpu
@@ -537,34 +559,39 @@ def import_csv(
                 normalized_days = time_utils.normalize_days_string(days)
                 if not normalized_days:
                     raise ValueError("Invalid Days. Example: M,W,F")
+                days_mask = time_utils.days_mask(normalized_days)
 
             if not preview:
-                ensure_entity(section, sections, models.Section)
-                ensure_entity(faculty_name, faculty, models.Faculty)
-                ensure_entity(room, rooms, models.Room)
-
-                entry = models.ScheduleEntry(
-                    program=program,
-                    section=section,
-                    course_code=course_code,
-                    course_description=course_description,
-                    units=float(units) if units else 0,
-                    hours=float(hours) if hours else 0,
-                    time_lpu=normalized_lpu,
-                    time_24=time_24,
-                    days=normalized_days,
-                    room=room,
-                    faculty=faculty_name,
-                    start_minutes=start_minutes,
-                    end_minutes=end_minutes,
-                )
-                db.add(entry)
+                new_sections.setdefault(intern(section.lower()), section)
+                new_faculty.setdefault(intern(faculty_name.lower()), faculty_name)
+                new_rooms.setdefault(intern(room.lower()), room)
+
+                pending.append({
+                    "program": program,
+                    "section": section,
+                    "course_code": course_code,
+                    "course_description": course_description,
+                    "units": float(units) if units else 0,
+                    "hours": float(hours) if hours else 0,
+                    "time_lpu": normalized_lpu,
+                    "time_24": time_24,
+                    "days": normalized_days,
+                    "days_mask": days_mask,
+                    "room": room,
+                    "faculty": faculty_name,
+                    "start_minutes": start_minutes,
+                    "end_minutes": end_minutes,
+                })
+                if len(pending) >= batch_size:
+                    flush_pending()
             rows_imported += 1
         except ValueError as exc:
             rows_skipped += 1
             errors.append({"row_index": idx, "reason": str(exc)})
 
     if not preview:
+        flush_pending()
+        insert_missing_entities()
         db.commit()
         crud.remove_unused_placeholder_entities(db)
 
@@ -601,8 +628,10 @@ def export_png(payload: dict):
         raise HTTPException(status_code=400, detail="Invalid category")
     if not name or not png_base64:
         raise HTTPException(status_code=400, detail="Missing export data")
-    if "," in png_base64:
-        png_base64 = png_base64.split(",", 1)[1]
+    # partition scans the string once, instead of an `in` scan plus a split.
+    _prefix, sep, payload_b64 = png_base64.partition(",")
+    if sep:
+        png_base64 = payload_b64
     try:
         data = base64.b64decode(png_base64)
     except ValueError as exc:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.sql import func
 
 from .db import Base
@@ -11,21 +11,30 @@ class ScheduleEntry(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     program = Column(String, nullable=False)
-    section = Column(String, nullable=False)
+    section = Column(String, nullable=False, index=True)
     course_code = Column(String, nullable=False)
     course_description = Column(String, nullable=False)
     units = Column(Float, nullable=False)
     hours = Column(Float, nullable=False)
     time_lpu = Column(String, nullable=False)
     time_24 = Column(String, nullable=True)
-    days = Column(String, nullable=False)
-    room = Column(String, nullable=False)
-    faculty = Column(String, nullable=False)
-    start_minutes = Column(Integer, nullable=True)
-    end_minutes = Column(Integer, nullable=True)
+    days = Column(String, nullable=False, index=True)
+    # 7-bit day encoding (M=1 .. Su=64); pair overlap is a single AND
+    # instead of re-parsing the comma-joined days string.
+    days_mask = Column(Integer, nullable=False, default=0, index=True)
+    room = Column(String, nullable=False, index=True)
+    faculty = Column(String, nullable=False, index=True)
+    start_minutes = Column(Integer, nullable=True, index=True)
+    end_minutes = Column(Integer, nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_schedule_entries_room_days", "room", "days"),
+        Index("ix_schedule_entries_faculty_days", "faculty", "days"),
+        Index("ix_schedule_entries_day_time", "days", "start_minutes", "end_minutes"),
+    )
+
 
 class Section(Base):
     __tablename__ = "sections"
@@ -8,33 +8,20 @@ from typing import Iterable
 
 from . import time_utils
 
-from .schemas import CANONICAL_HEADERS
 
-
-def build_text_rows(entries: Iterable[dict]) -> list[list[str]]:
-    rows = [CANONICAL_HEADERS]
-    for entry in entries:
-        rows.append([
-            entry["Program"],
-            entry["Section"],
-            entry["Course Code"],
-            entry["Course Description"],
-            str(entry["Units"]),
-            str(entry["# of Hours"]),
-            entry["Time (LPU Std)"],
-            entry["Time (24 Hrs)"],
-            entry["Days"],
-            entry["Room"],
-            entry["Faculty"],
-        ])
-    return rows
-
-
-def write_csv(rows: list[list[str]]) -> bytes:
+def stream_csv(rows: Iterable[Iterable], chunk_size: int = 64 * 1024):
+    # Yields encoded chunks as they fill instead of materializing the whole
+    # document; the client sees the first bytes before the scan finishes.
     buffer = io.StringIO()
     writer = csv.writer(buffer)
-    writer.writerows(rows)
-    return buffer.getvalue().encode("utf-8")
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
 
 
 def _faculty_entry_hours(entry: dict) -> float:
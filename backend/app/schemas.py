@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 CANONICAL_HEADERS = [
@@ -33,8 +33,7 @@ class ScheduleEntryBase(BaseModel):
     room: str = Field(..., alias="Room")
     faculty: str = Field(..., alias="Faculty")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ScheduleEntryCreate(ScheduleEntryBase):
@@ -48,17 +47,14 @@ class ScheduleEntryUpdate(ScheduleEntryBase):
 class ScheduleEntry(ScheduleEntryBase):
     id: int
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class NamedEntity(BaseModel):
     id: int
     name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NamedEntityCreate(BaseModel):
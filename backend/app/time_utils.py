@@ -1,30 +1,60 @@
 from __future__ import annotations
 
-import re
-
-TIME_RANGE_RE = re.compile(r"^(\d{2}):(\d{2})-(\d{2}):(\d{2})$")
-LPU_TIME_RE = re.compile(
-    r"^\s*(\d{1,2}):(\d{2})\s*([ap])\s*-\s*(\d{1,2}):(\d{2})\s*([ap])\s*$",
-    re.IGNORECASE,
-)
+import functools
+
+
+def _scan_lpu_half(text: str) -> tuple[int, int, str] | None:
+    # One half of an LPU time: 1-2 digit hour, ':', two minute digits,
+    # optional spaces, then an a/p meridian (any case).
+    text = text.strip()
+    length = len(text)
+    hour = 0
+    pos = 0
+    while pos < length and "0" <= text[pos] <= "9":
+        hour = hour * 10 + (ord(text[pos]) - 48)
+        pos += 1
+    if pos < 1 or pos > 2 or pos >= length or text[pos] != ":":
+        return None
+    if pos + 3 > length or not ("0" <= text[pos + 1] <= "9" and "0" <= text[pos + 2] <= "9"):
+        return None
+    minute = (ord(text[pos + 1]) - 48) * 10 + (ord(text[pos + 2]) - 48)
+    pos += 3
+    while pos < length and text[pos].isspace():
+        pos += 1
+    if pos + 1 != length:
+        return None
+    meridian = text[pos].lower()
+    if meridian != "a" and meridian != "p":
+        return None
+    return hour, minute, meridian
 
 
 def parse_time_range(time_24: str) -> tuple[int, int]:
-    match = TIME_RANGE_RE.match(time_24.strip())
-    if not match:
+    # The layout is fixed (HH:MM-HH:MM), so positional checks and integer
+    # slicing beat a regex match plus per-group int conversion.
+    value = time_24.strip()
+    if (
+        len(value) != 11
+        or value[2] != ":"
+        or value[5] != "-"
+        or value[8] != ":"
+        or not (value[0:2] + value[3:5] + value[6:8] + value[9:11]).isdigit()
+    ):
         raise ValueError("Time (24 Hrs) must be in HH:MM-HH:MM format")
-    start_h, start_m, end_h, end_m = (int(val) for val in match.groups())
-    start_minutes = start_h * 60 + start_m
-    end_minutes = end_h * 60 + end_m
+    start_minutes = int(value[0:2]) * 60 + int(value[3:5])
+    end_minutes = int(value[6:8]) * 60 + int(value[9:11])
     if start_minutes >= end_minutes:
         raise ValueError("Start time must be before end time")
     return start_minutes, end_minutes
 
 
+# Every HH:MM string for the bounded 0..1439 domain, built once at import;
+# formatting becomes a tuple index instead of an f-string interpolation.
+_FMT24 = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60))
+
+
 def format_time_24(minutes: int) -> str:
-    hours = minutes // 60
-    mins = minutes % 60
-    return f"{hours:02d}:{mins:02d}"
+    return _FMT24[minutes]
 
 
 def format_time_lpu(minutes: int) -> str:
@@ -36,30 +66,30 @@ def format_time_lpu(minutes: int) -> str:
 
 
 def _to_minutes(hour: int, minute: int, meridian: str) -> int:
+    # meridian arrives already lowercased from the scanner. hour % 12 folds
+    # the 12am/12pm specials into one expression: 12a -> 0, 12p -> 12.
     if hour < 1 or hour > 12 or minute < 0 or minute > 59:
         raise ValueError("Invalid time component")
-    meridian = meridian.lower()
-    if meridian == "a":
-        hour = 0 if hour == 12 else hour
-    else:
-        hour = 12 if hour == 12 else hour + 12
-    return hour * 60 + minute
+    return (hour % 12 + (12 if meridian == "p" else 0)) * 60 + minute
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_time_lpu(time_lpu: str) -> tuple[str, str, int, int]:
-    match = LPU_TIME_RE.match(time_lpu)
-    if not match:
+    halves = time_lpu.split("-")
+    start = _scan_lpu_half(halves[0]) if len(halves) == 2 else None
+    end = _scan_lpu_half(halves[1]) if start else None
+    if start is None or end is None:
         raise ValueError("Invalid Time (LPU Std). Example: 10:00a-12:00p")
-    start_h, start_m, start_ampm, end_h, end_m, end_ampm = match.groups()
-    start_minutes = _to_minutes(int(start_h), int(start_m), start_ampm)
-    end_minutes = _to_minutes(int(end_h), int(end_m), end_ampm)
+    start_minutes = _to_minutes(*start)
+    end_minutes = _to_minutes(*end)
     if start_minutes >= end_minutes:
         raise ValueError("Invalid Time (LPU Std). Example: 10:00a-12:00p")
     normalized_lpu = f"{format_time_lpu(start_minutes)}-{format_time_lpu(end_minutes)}"
-    time_24 = f"{format_time_24(start_minutes)}-{format_time_24(end_minutes)}"
+    time_24 = _FMT24[start_minutes] + "-" + _FMT24[end_minutes]
     return normalized_lpu, time_24, start_minutes, end_minutes
 
 
+@functools.lru_cache(maxsize=1024)
 def is_tba(value: str | None) -> bool:
     if value is None:
         return True
@@ -96,50 +126,64 @@ DAY_ALIASES = {
     "sunday": "Su",
 }
 
-CANONICAL_DAYS = {"M", "T", "W", "Th", "F", "Sa", "Su"}
+# Compact-day scanning via C-level string ops: the two-char tokens are
+# collapsed to one-char sentinels first, then every character maps through
+# this dict; unknown characters are dropped.
+_COMPACT_TOKENS = {
+    "m": "M",
+    "t": "T",
+    "w": "W",
+    "f": "F",
+    "\x01": "Th",
+    "\x02": "Sa",
+    "\x03": "Su",
+}
 
 
 def _parse_compact_days(value: str) -> list[str]:
-    tokens = []
-    idx = 0
-    while idx < len(value):
-        if value[idx : idx + 2].lower() == "th":
-            tokens.append("Th")
-            idx += 2
-        elif value[idx : idx + 2].lower() == "sa":
-            tokens.append("Sa")
-            idx += 2
-        elif value[idx : idx + 2].lower() == "su":
-            tokens.append("Su")
-            idx += 2
-        else:
-            char = value[idx].lower()
-            tokens.append(DAY_ALIASES.get(char, value[idx]))
-            idx += 1
-    return tokens
+    collapsed = value.lower().replace("th", "\x01").replace("sa", "\x02").replace("su", "\x03")
+    return [_COMPACT_TOKENS[char] for char in collapsed if char in _COMPACT_TOKENS]
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_days_string(days: str) -> str:
     if not days:
         return ""
     raw = days.replace("/", ",").replace(" ", ",")
     parts = [part for part in raw.split(",") if part]
     if len(parts) == 1 and len(parts[0]) > 2 and parts[0].isalpha():
-        tokens = _parse_compact_days(parts[0])
+        normalized = _parse_compact_days(parts[0])
     else:
-        tokens = []
+        # Every DAY_ALIASES value is already canonical, so one lookup both
+        # maps and filters; no separate canonical-day membership check.
+        normalized = []
         for part in parts:
-            key = part.strip().lower()
-            if not key:
-                continue
-            tokens.append(DAY_ALIASES.get(key, part.strip()))
-    normalized = [token for token in tokens if token in CANONICAL_DAYS]
+            token = DAY_ALIASES.get(part.strip().lower())
+            if token:
+                normalized.append(token)
     return ",".join(normalized)
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalize_days_tuple(days: str) -> tuple[str, ...]:
+    return tuple(token for token in normalize_days_string(days).split(",") if token)
+
+
 def normalize_days(days: str) -> set[str]:
-    normalized = normalize_days_string(days)
-    return {token for token in normalized.split(",") if token}
+    # Callers mutate-test membership on the result, so build a fresh set
+    # from the cached tuple instead of caching a mutable set.
+    return set(_normalize_days_tuple(days))
+
+
+DAY_BITS = {"M": 1, "T": 2, "W": 4, "Th": 8, "F": 16, "Sa": 32, "Su": 64}
+
+
+@functools.lru_cache(maxsize=256)
+def days_mask(days: str) -> int:
+    mask = 0
+    for token in normalize_days(days):
+        mask |= DAY_BITS[token]
+    return mask
 
 
 def overlap(start_a: int, end_a: int, start_b: int, end_b: int) -> bool:
@@ -5,21 +5,29 @@ import threading
 import webbrowser
 from pathlib import Path
 
-import uvicorn
+# Constant per binary; resolve() stats the filesystem, so do it once.
+ROOT = Path(__file__).resolve().parent
+_ROOT_STR = str(ROOT)
 
 from app.main import app as fastapi_app
 
 
 def main() -> None:
-    root = Path(__file__).resolve().parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
+    if _ROOT_STR not in sys.path:
+        sys.path.insert(0, _ROOT_STR)
+
+    # uvicorn (and its click/h11 dependency tree) is imported only once the
+    # app is actually starting, shortening the splash-to-serving window.
+    import uvicorn
 
     def open_browser() -> None:
         webbrowser.open("http://127.0.0.1:8000")
 
     threading.Timer(1.0, open_browser).start()
-    uvicorn.run(fastapi_app, host="127.0.0.1", port=8000, log_level="info")
+    config = uvicorn.Config(
+        fastapi_app, host="127.0.0.1", port=8000, log_level="info", loop="asyncio", http="h11"
+    )
+    uvicorn.Server(config).run()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,11 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 TEST_DATABASE_PATH = ROOT / "tests" / "scheduler-test.db"
-if TEST_DATABASE_PATH.exists():
-    TEST_DATABASE_PATH.unlink()
+for stale in (
+    TEST_DATABASE_PATH,
+    TEST_DATABASE_PATH.with_name(TEST_DATABASE_PATH.name + "-wal"),
+    TEST_DATABASE_PATH.with_name(TEST_DATABASE_PATH.name + "-shm"),
+):
+    if stale.exists():
+        stale.unlink()
 os.environ["SCHEDULER_DB_PATH"] = str(TEST_DATABASE_PATH)
@@ -1,18 +1,26 @@
+import asyncio
 from uuid import uuid4
 
-from fastapi.testclient import TestClient
+import pytest
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 
-client = TestClient(app)
 
+@pytest.fixture
+async def client():
+    # ASGITransport calls the app in-process without TestClient's
+    # thread-and-portal shim around every request.
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
-def test_schedule_list_endpoint():
-    response = client.get("/schedule")
+
+async def test_schedule_list_endpoint(client):
+    response = await client.get("/schedule")
     assert response.status_code == 200
 
 
-def test_create_and_delete_schedule_entry():
+async def test_create_and_delete_schedule_entry(client):
     payload = {
         "Program": "BSCS",
         "Section": "A",
@@ -26,15 +34,15 @@ def test_create_and_delete_schedule_entry():
         "Room": "R101",
         "Faculty": "Dr. Ada",
     }
-    create_response = client.post("/schedule", json=payload)
+    create_response = await client.post("/schedule", json=payload)
     assert create_response.status_code == 200
     entry_id = create_response.json()["id"]
 
-    delete_response = client.delete(f"/schedule/{entry_id}")
+    delete_response = await client.delete(f"/schedule/{entry_id}")
     assert delete_response.status_code == 200
 
 
-def test_same_section_overlap_is_rejected_on_create_and_move_check():
+async def test_same_section_overlap_is_rejected_on_create_and_move_check(client):
     suffix = uuid4().hex[:8]
     section = f"BUG-SECTION-{suffix}"
     first_payload = {
@@ -57,28 +65,33 @@ def test_same_section_overlap_is_rejected_on_create_and_move_check():
         "Room": f"Room B {suffix}",
         "Faculty": f"Faculty B {suffix}",
     }
-    create_response = client.post("/schedule", json=first_payload)
+    create_response = await client.post("/schedule", json=first_payload)
     assert create_response.status_code == 200
     entry_id = create_response.json()["id"]
 
-    move_check_response = client.post("/schedule/0/move-check", json=second_payload)
+    move_check_response = await client.post("/schedule/0/move-check", json=second_payload)
     assert move_check_response.status_code == 200
     move_check_body = move_check_response.json()
     assert move_check_body["ok"] is False
     assert move_check_body["conflicts"][0]["conflict_type"] == "section"
 
-    blocked_create_response = client.post("/schedule", json=second_payload)
+    blocked_create_response = await client.post("/schedule", json=second_payload)
     assert blocked_create_response.status_code == 422
     assert blocked_create_response.json()["detail"] == "Section has another class at the same time"
 
-    assert client.delete(f"/schedule/{entry_id}").status_code == 200
+    assert (await client.delete(f"/schedule/{entry_id}")).status_code == 200
 
 
-def test_reports_and_conflicts_endpoints():
-    assert client.get("/conflicts").status_code == 200
-    assert client.get("/reports/text.csv").status_code == 200
-    assert client.get("/reports/timetable/section.csv").status_code == 200
-    response = client.get("/reports/faculty-load.html", params={"faculty": "Dr. Ada"})
+async def test_reports_and_conflicts_endpoints(client):
+    conflicts_response, text_response, timetable_response = await asyncio.gather(
+        client.get("/conflicts"),
+        client.get("/reports/text.csv"),
+        client.get("/reports/timetable/section.csv"),
+    )
+    assert conflicts_response.status_code == 200
+    assert text_response.status_code == 200
+    assert timetable_response.status_code == 200
+    response = await client.get("/reports/faculty-load.html", params={"faculty": "Dr. Ada"})
     assert response.status_code == 200
     assert response.headers["content-type"].startswith("text/html")
     assert "Faculty Load" in response.text
@@ -121,25 +134,25 @@ def test_faculty_load_report_totals_lecture_and_lab():
     assert "Laboratory 2" in report
 
 
-def test_update_and_delete_section():
+async def test_update_and_delete_section(client):
     suffix = uuid4().hex[:8]
-    create_response = client.post("/sections", json={"name": f"TEMP-A-{suffix}"})
+    create_response = await client.post("/sections", json={"name": f"TEMP-A-{suffix}"})
     assert create_response.status_code == 200
     section_id = create_response.json()["id"]
 
-    update_response = client.put(f"/sections/{section_id}", json={"name": f"TEMP-B-{suffix}"})
+    update_response = await client.put(f"/sections/{section_id}", json={"name": f"TEMP-B-{suffix}"})
     assert update_response.status_code == 200
     assert update_response.json()["name"] == f"TEMP-B-{suffix}"
 
-    delete_response = client.delete(f"/sections/{section_id}")
+    delete_response = await client.delete(f"/sections/{section_id}")
     assert delete_response.status_code == 200
 
 
-def test_section_rename_updates_entries_and_delete_is_blocked_when_used():
+async def test_section_rename_updates_entries_and_delete_is_blocked_when_used(client):
     suffix = uuid4().hex[:8]
     section_name = f"TEMP-C-{suffix}"
     renamed_section = f"TEMP-D-{suffix}"
-    create_section_response = client.post("/sections", json={"name": section_name})
+    create_section_response = await client.post("/sections", json={"name": section_name})
     assert create_section_response.status_code == 200
     section_id = create_section_response.json()["id"]
     payload = {
@@ -155,25 +168,25 @@ def test_section_rename_updates_entries_and_delete_is_blocked_when_used():
         "Room": "TBA",
         "Faculty": "TBA",
     }
-    create_entry_response = client.post("/schedule", json=payload)
+    create_entry_response = await client.post("/schedule", json=payload)
     assert create_entry_response.status_code == 200
     entry_id = create_entry_response.json()["id"]
 
-    update_response = client.put(f"/sections/{section_id}", json={"name": renamed_section})
+    update_response = await client.put(f"/sections/{section_id}", json={"name": renamed_section})
     assert update_response.status_code == 200
-    assert client.get(f"/schedule/{entry_id}").json()["Section"] == renamed_section
+    assert (await client.get(f"/schedule/{entry_id}")).json()["Section"] == renamed_section
 
-    blocked_delete_response = client.delete(f"/sections/{section_id}")
+    blocked_delete_response = await client.delete(f"/sections/{section_id}")
     assert blocked_delete_response.status_code == 409
 
-    assert client.delete(f"/schedule/{entry_id}").status_code == 200
-    assert client.delete(f"/sections/{section_id}").status_code == 200
+    assert (await client.delete(f"/schedule/{entry_id}")).status_code == 200
+    assert (await client.delete(f"/sections/{section_id}")).status_code == 200
 
 
-def test_force_delete_section_removes_related_entries():
+async def test_force_delete_section_removes_related_entries(client):
     suffix = uuid4().hex[:8]
     section_name = f"FORCE-SECTION-{suffix}"
-    create_section_response = client.post("/sections", json={"name": section_name})
+    create_section_response = await client.post("/sections", json={"name": section_name})
     assert create_section_response.status_code == 200
     section_id = create_section_response.json()["id"]
     payload = {
@@ -189,24 +202,24 @@ def test_force_delete_section_removes_related_entries():
         "Room": "TBA",
         "Faculty": "TBA",
     }
-    create_entry_response = client.post("/schedule", json=payload)
+    create_entry_response = await client.post("/schedule", json=payload)
     assert create_entry_response.status_code == 200
     entry_id = create_entry_response.json()["id"]
 
-    forced_delete_response = client.delete(f"/sections/{section_id}?force=true")
+    forced_delete_response = await client.delete(f"/sections/{section_id}?force=true")
     assert forced_delete_response.status_code == 200
-    assert client.get(f"/schedule/{entry_id}").status_code == 404
+    assert (await client.get(f"/schedule/{entry_id}")).status_code == 404
 
 
-def test_faculty_and_room_renames_update_entries_and_force_delete_removes_entries():
+async def test_faculty_and_room_renames_update_entries_and_force_delete_removes_entries(client):
     suffix = uuid4().hex[:8]
     faculty_name = f"FAC-A-{suffix}"
     renamed_faculty = f"FAC-B-{suffix}"
     room_name = f"ROOM-A-{suffix}"
     renamed_room = f"ROOM-B-{suffix}"
 
-    faculty_response = client.post("/faculty", json={"name": faculty_name})
-    room_response = client.post("/rooms", json={"name": room_name})
+    faculty_response = await client.post("/faculty", json={"name": faculty_name})
+    room_response = await client.post("/rooms", json={"name": room_name})
     assert faculty_response.status_code == 200
     assert room_response.status_code == 200
     faculty_id = faculty_response.json()["id"]
@@ -225,33 +238,33 @@ def test_faculty_and_room_renames_update_entries_and_force_delete_removes_entrie
         "Room": room_name,
         "Faculty": faculty_name,
     }
-    create_entry_response = client.post("/schedule", json=payload)
+    create_entry_response = await client.post("/schedule", json=payload)
     assert create_entry_response.status_code == 200
     entry_id = create_entry_response.json()["id"]
 
-    faculty_update = client.put(f"/faculty/{faculty_id}", json={"name": renamed_faculty})
-    room_update = client.put(f"/rooms/{room_id}", json={"name": renamed_room})
+    faculty_update = await client.put(f"/faculty/{faculty_id}", json={"name": renamed_faculty})
+    room_update = await client.put(f"/rooms/{room_id}", json={"name": renamed_room})
     assert faculty_update.status_code == 200
     assert room_update.status_code == 200
-    renamed_entry = client.get(f"/schedule/{entry_id}").json()
+    renamed_entry = (await client.get(f"/schedule/{entry_id}")).json()
     assert renamed_entry["Faculty"] == renamed_faculty
     assert renamed_entry["Room"] == renamed_room
 
-    blocked_delete_response = client.delete(f"/faculty/{faculty_id}")
+    blocked_delete_response = await client.delete(f"/faculty/{faculty_id}")
     assert blocked_delete_response.status_code == 409
 
-    forced_delete_response = client.delete(f"/faculty/{faculty_id}?force=true")
+    forced_delete_response = await client.delete(f"/faculty/{faculty_id}?force=true")
     assert forced_delete_response.status_code == 200
-    assert client.get(f"/schedule/{entry_id}").status_code == 404
-    assert client.delete(f"/rooms/{room_id}").status_code == 200
+    assert (await client.get(f"/schedule/{entry_id}")).status_code == 404
+    assert (await client.delete(f"/rooms/{room_id}")).status_code == 200
 
 
-def test_post_remove_faculty_and_room_force_removes_related_entries():
+async def test_post_remove_faculty_and_room_force_removes_related_entries(client):
     suffix = uuid4().hex[:8]
     faculty_name = f"POST-FAC-{suffix}"
     room_name = f"POST-ROOM-{suffix}"
-    faculty_id = client.post("/faculty", json={"name": faculty_name}).json()["id"]
-    room_id = client.post("/rooms", json={"name": room_name}).json()["id"]
+    faculty_id = (await client.post("/faculty", json={"name": faculty_name})).json()["id"]
+    room_id = (await client.post("/rooms", json={"name": room_name})).json()["id"]
     payload = {
         "Program": "BSCS",
         "Section": f"POST-SEC-{suffix}",
@@ -265,20 +278,20 @@ def test_post_remove_faculty_and_room_force_removes_related_entries():
         "Room": room_name,
         "Faculty": faculty_name,
     }
-    entry_id = client.post("/schedule", json=payload).json()["id"]
+    entry_id = (await client.post("/schedule", json=payload)).json()["id"]
 
-    blocked_response = client.post(f"/faculty/{faculty_id}/remove")
+    blocked_response = await client.post(f"/faculty/{faculty_id}/remove")
     assert blocked_response.status_code == 409
-    force_response = client.post(f"/faculty/{faculty_id}/remove?force=true")
+    force_response = await client.post(f"/faculty/{faculty_id}/remove?force=true")
     assert force_response.status_code == 200
-    assert client.get(f"/schedule/{entry_id}").status_code == 404
-    assert client.post(f"/rooms/{room_id}/remove").status_code == 200
+    assert (await client.get(f"/schedule/{entry_id}")).status_code == 404
+    assert (await client.post(f"/rooms/{room_id}/remove")).status_code == 200
 
 
-def test_legacy_delete_faculty_succeeds_after_related_entries_are_removed():
+async def test_legacy_delete_faculty_succeeds_after_related_entries_are_removed(client):
     suffix = uuid4().hex[:8]
     faculty_name = f"LEGACY-FAC-{suffix}"
-    faculty_id = client.post("/faculty", json={"name": faculty_name}).json()["id"]
+    faculty_id = (await client.post("/faculty", json={"name": faculty_name})).json()["id"]
     payload = {
         "Program": "BSCS",
         "Section": f"LEGACY-SEC-{suffix}",
@@ -292,18 +305,18 @@ def test_legacy_delete_faculty_succeeds_after_related_entries_are_removed():
         "Room": "TBA",
         "Faculty": faculty_name,
     }
-    entry_id = client.post("/schedule", json=payload).json()["id"]
+    entry_id = (await client.post("/schedule", json=payload)).json()["id"]
 
-    assert client.delete(f"/schedule/{entry_id}").status_code == 200
-    assert client.delete(f"/faculty/{faculty_id}").status_code == 200
+    assert (await client.delete(f"/schedule/{entry_id}")).status_code == 200
+    assert (await client.delete(f"/faculty/{faculty_id}")).status_code == 200
 
 
-def test_merge_faculty_updates_entries_when_no_conflict():
+async def test_merge_faculty_updates_entries_when_no_conflict(client):
     suffix = uuid4().hex[:8]
     source_name = f"MERGE-FAC-A-{suffix}"
     target_name = f"MERGE-FAC-B-{suffix}"
-    source_id = client.post("/faculty", json={"name": source_name}).json()["id"]
-    target_response = client.post("/faculty", json={"name": target_name})
+    source_id = (await client.post("/faculty", json={"name": source_name})).json()["id"]
+    target_response = await client.post("/faculty", json={"name": target_name})
     assert target_response.status_code == 200
 
     payload = {
@@ -319,26 +332,26 @@ def test_merge_faculty_updates_entries_when_no_conflict():
         "Room": f"ROOM-A-{suffix}",
         "Faculty": source_name,
     }
-    entry_id = client.post("/schedule", json=payload).json()["id"]
+    entry_id = (await client.post("/schedule", json=payload)).json()["id"]
 
-    merge_response = client.put(f"/faculty/{source_id}?merge=true", json={"name": target_name})
+    merge_response = await client.put(f"/faculty/{source_id}?merge=true", json={"name": target_name})
     assert merge_response.status_code == 200
-    assert client.get(f"/schedule/{entry_id}").json()["Faculty"] == target_name
-    assert all(item["name"] != source_name for item in client.get("/faculty").json())
+    assert (await client.get(f"/schedule/{entry_id}")).json()["Faculty"] == target_name
+    assert all(item["name"] != source_name for item in (await client.get("/faculty")).json())
 
-    assert client.delete(f"/schedule/{entry_id}").status_code == 200
+    assert (await client.delete(f"/schedule/{entry_id}")).status_code == 200
 
 
-def test_merge_faculty_and_room_are_blocked_when_conflicts_would_result():
+async def test_merge_faculty_and_room_are_blocked_when_conflicts_would_result(client):
     suffix = uuid4().hex[:8]
     source_faculty = f"BLOCK-FAC-A-{suffix}"
     target_faculty = f"BLOCK-FAC-B-{suffix}"
     source_room = f"BLOCK-ROOM-A-{suffix}"
     target_room = f"BLOCK-ROOM-B-{suffix}"
-    faculty_id = client.post("/faculty", json={"name": source_faculty}).json()["id"]
-    room_id = client.post("/rooms", json={"name": source_room}).json()["id"]
-    assert client.post("/faculty", json={"name": target_faculty}).status_code == 200
-    assert client.post("/rooms", json={"name": target_room}).status_code == 200
+    faculty_id = (await client.post("/faculty", json={"name": source_faculty})).json()["id"]
+    room_id = (await client.post("/rooms", json={"name": source_room})).json()["id"]
+    assert (await client.post("/faculty", json={"name": target_faculty})).status_code == 200
+    assert (await client.post("/rooms", json={"name": target_room})).status_code == 200
 
     first_payload = {
         "Program": "BSCS",
@@ -361,15 +374,15 @@ def test_merge_faculty_and_room_are_blocked_when_conflicts_would_result():
         "Room": target_room,
         "Faculty": target_faculty,
     }
-    first_id = client.post("/schedule", json=first_payload).json()["id"]
-    second_id = client.post("/schedule", json=second_payload).json()["id"]
+    first_id = (await client.post("/schedule", json=first_payload)).json()["id"]
+    second_id = (await client.post("/schedule", json=second_payload)).json()["id"]
 
-    faculty_merge = client.put(f"/faculty/{faculty_id}?merge=true", json={"name": target_faculty})
-    room_merge = client.put(f"/rooms/{room_id}?merge=true", json={"name": target_room})
+    faculty_merge = await client.put(f"/faculty/{faculty_id}?merge=true", json={"name": target_faculty})
+    room_merge = await client.put(f"/rooms/{room_id}?merge=true", json={"name": target_room})
     assert faculty_merge.status_code == 409
     assert room_merge.status_code == 409
-    assert client.get(f"/schedule/{first_id}").json()["Faculty"] == source_faculty
-    assert client.get(f"/schedule/{first_id}").json()["Room"] == source_room
+    assert (await client.get(f"/schedule/{first_id}")).json()["Faculty"] == source_faculty
+    assert (await client.get(f"/schedule/{first_id}")).json()["Room"] == source_room
 
-    assert client.delete(f"/schedule/{first_id}").status_code == 200
-    assert client.delete(f"/schedule/{second_id}").status_code == 200
+    assert (await client.delete(f"/schedule/{first_id}")).status_code == 200
+    assert (await client.delete(f"/schedule/{second_id}")).status_code == 200
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app import conflicts, models, time_utils
 from app import crud
 
+# One shared in-memory engine with the schema created once; each test runs
+# inside an outer transaction that is rolled back, so session commits land
+# in savepoints and tests stay isolated without rebuilding the schema.
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+models.Base.metadata.create_all(bind=engine)
 
-def setup_db():
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
-    models.Base.metadata.create_all(bind=engine)
-    return sessionmaker(bind=engine)()
+
+@pytest.fixture
+def db():
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
 
 
 def test_overlap_logic():
@@ -19,8 +36,7 @@ def test_overlap_logic():
     assert time_utils.overlap(60, 120, 0, 59) is False
 
 
-def test_conflict_detection_room_and_faculty():
-    db = setup_db()
+def test_conflict_detection_room_and_faculty(db):
     entry_a = models.ScheduleEntry(
         program="BSCS",
         section="A",
@@ -55,13 +71,12 @@ def test_conflict_detection_room_and_faculty():
     db.commit()
 
     conflicts_found = conflicts.find_conflicts(db)
-    conflict_types = {(c["entry_id"], c["conflict_type"]) for c in conflicts_found}
+    conflict_types = {(c.entry_id, c.conflict_type) for c in conflicts_found}
     assert (entry_a.id, "room") in conflict_types
     assert (entry_a.id, "faculty") in conflict_types
 
 
-def test_conflict_detection_same_section_different_room_and_faculty():
-    db = setup_db()
+def test_conflict_detection_same_section_different_room_and_faculty(db):
     entry_a = models.ScheduleEntry(
         program="BSPharm",
         section="BS Pharm 1A",
@@ -96,13 +111,44 @@ def test_conflict_detection_same_section_different_room_and_faculty():
     db.commit()
 
     conflicts_found = conflicts.find_conflicts(db)
-    conflict_types = {(c["entry_id"], c["conflict_type"]) for c in conflicts_found}
+    conflict_types = {(c.entry_id, c.conflict_type) for c in conflicts_found}
     assert (entry_a.id, "section") in conflict_types
     assert (entry_b.id, "section") in conflict_types
 
 
-def test_remove_unused_placeholder_entities_when_real_data_exists():
-    db = setup_db()
+def test_numpy_conflict_path_matches_python_sweep(db, monkeypatch):
+    for idx in range(12):
+        offset = 30 * (idx % 4)
+        db.add(
+            models.ScheduleEntry(
+                program="BSCS",
+                section=f"S{idx % 3}",
+                course_code=f"C{idx}",
+                course_description=f"Course {idx}",
+                units=3,
+                hours=3,
+                time_lpu="7:00a-9:00a",
+                time_24="07:00-09:00",
+                days="M,W" if idx % 2 else "W,F",
+                room=f"R{idx % 4}",
+                faculty=f"F{idx % 5}",
+                start_minutes=420 + offset,
+                end_minutes=540 + offset,
+            )
+        )
+    db.commit()
+
+    def as_keys(found):
+        return {(c.entry_id, c.conflicts_with, c.conflict_type) for c in found}
+
+    expected = as_keys(conflicts.find_conflicts(db))
+    assert expected
+
+    monkeypatch.setattr(conflicts, "NUMPY_MIN_ENTRIES", 1)
+    assert as_keys(conflicts.find_conflicts(db)) == expected
+
+
+def test_remove_unused_placeholder_entities_when_real_data_exists(db):
     db.add_all(
         [
             models.Section(name="No section yet"),
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import inspect
+
+from app import time_utils
+
+
+def test_single_canonical_time_utils_module():
+    # Guard against a stale duplicate module shadowing the canonical one:
+    # the imported time_utils must be the app copy with the compact-day
+    # parser, not a reduced variant picked up earlier on sys.path.
+    source = inspect.getsourcefile(time_utils)
+    assert source is not None
+    assert source.endswith("app/time_utils.py")
+    assert hasattr(time_utils, "_parse_compact_days")